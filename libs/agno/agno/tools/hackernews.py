@@ -1,32 +1,300 @@
+import asyncio
 import json
-from typing import Any, List
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple
 
 import httpx
 
 from agno.tools import Toolkit
 from agno.utils.log import log_debug, logger
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None  # type: ignore
+
+_BASE_URL = "https://hacker-news.firebaseio.com"
+# Bound str.format of the item path, looked up once rather than per request
+_ITEM_PATH = "/v0/item/{}.json".format
+# The top stories ranking is stable for tens of seconds, so the ID list is reused for this long
+_TOPSTORIES_TTL = 30.0
+# Items keep changing (score, comment count) while they are on the front page, so they also expire
+_ITEM_TTL = 60.0
+_ITEM_CACHE_SIZE = 1024
+
+
+# Shared by every HackerNewsTools instance on the same event loop, so they all reuse one connection pool
+# and TLS session. Keyed by loop because an AsyncClient's connections are bound to the loop that opened them.
+# Sync calls run on each toolkit's own background loop, so they share that toolkit's client across calls.
+# Each client is paired with the async generator that closes it when its loop shuts down.
+_AsyncClientEntry = Tuple[httpx.AsyncClient, AsyncGenerator[None, None]]
+_ASYNC_CLIENTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _AsyncClientEntry]" = weakref.WeakKeyDictionary()
+
+
+async def _async_client_lifetime(client: httpx.AsyncClient) -> AsyncGenerator[None, None]:
+    """Keep `client` open until the event loop finalizes this generator.
+
+    asyncio.run(), uvloop.run() and HackerNewsTools.close() call loop.shutdown_asyncgens() before closing the
+    loop, which runs the `finally` block below while the loop can still await, so the pooled connections are
+    released with it.
+    """
+    try:
+        yield
+    finally:
+        loop = asyncio.get_running_loop()
+        entry = _ASYNC_CLIENTS.get(loop)
+        if entry is not None and entry[0] is client:
+            del _ASYNC_CLIENTS[loop]
+        await client.aclose()
+
+
+async def _aget_async_client() -> httpx.AsyncClient:
+    """Return the shared async client for the running event loop, creating it if necessary."""
+    loop = asyncio.get_running_loop()
+    entry = _ASYNC_CLIENTS.get(loop)
+    if entry is not None and not entry[0].is_closed:
+        return entry[0]
+
+    # Drop clients of loops that were closed without shutting down their async generators.
+    # They can no longer be awaited, but releasing them lets their connections be garbage collected.
+    for closed_loop in [other for other in list(_ASYNC_CLIENTS.keys()) if other.is_closed()]:
+        _ASYNC_CLIENTS.pop(closed_loop, None)
+
+    client = httpx.AsyncClient(base_url=_BASE_URL, http2=True, limits=httpx.Limits(max_keepalive_connections=64))
+    lifetime = _async_client_lifetime(client)
+    # Registered before the first await, so concurrent callers on this loop get the same client
+    _ASYNC_CLIENTS[loop] = (client, lifetime)
+    # Start the generator so the loop tracks it and finalizes it on shutdown
+    await lifetime.__anext__()
+    return client
+
+
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create an event loop, using uvloop when it is installed."""
+    if uvloop is not None:
+        return uvloop.new_event_loop()
+    return asyncio.new_event_loop()
+
+
+def _stop_loop(loop: asyncio.AbstractEventLoop, thread: threading.Thread) -> None:
+    """Stop a background event loop and close it, along with the client it shares."""
+    if loop.is_closed():
+        return
+    loop.call_soon_threadsafe(loop.stop)
+    if thread is threading.current_thread():
+        # Called from the loop's own thread, which can't wait for itself to finish
+        return
+    thread.join()
+    # Finalizes the client lifetime generators started on the loop, which closes their connections
+    loop.run_until_complete(loop.shutdown_asyncgens())
+    loop.close()
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize `obj` to a JSON string, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
+def _loads(response: httpx.Response) -> Any:
+    """Decode the JSON body of `response`, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
 
 class HackerNewsTools(Toolkit):
     """
     HackerNews is a tool for getting top stories from Hacker News.
 
+    Requests are made over HTTP/2, so the item requests for the top stories are multiplexed
+    as concurrent streams on a single connection rather than queued behind each other.
+
+    Async calls share one client per event loop across toolkits. Sync calls run on an event loop
+    thread owned by the toolkit, started on first use, so their client and its TLS connection are
+    also kept alive from one call to the next. Call `close()` to stop the thread.
+
+    Install `orjson` (`pip install "agno[hackernews]"`) for faster JSON encoding and decoding.
+    The same extra installs `uvloop` (outside Windows), which is then used for the event loop of
+    sync calls. Async calls use the caller's loop, so run the application itself with uvloop to
+    speed those up too.
+
     Args:
         enable_get_top_stories (bool): Enable getting top stories from Hacker News. Default is True.
         enable_get_user_details (bool): Enable getting user details from Hacker News. Default is True.
         all (bool): Enable all tools. Overrides individual flags when True. Default is False.
+        timeout (float): Timeout in seconds for requests to the Hacker News API. Default is 10.0.
+        max_concurrency (int): Maximum number of item requests in flight at once. Default is 16.
     """
 
     def __init__(
-        self, enable_get_top_stories: bool = True, enable_get_user_details: bool = True, all: bool = False, **kwargs
+        self,
+        enable_get_top_stories: bool = True,
+        enable_get_user_details: bool = True,
+        all: bool = False,
+        timeout: float = 10.0,
+        max_concurrency: int = 16,
+        **kwargs,
     ):
+        self.timeout: float = timeout
+        self.max_concurrency: int = max_concurrency
+        # Created lazily and reused so that connections are kept alive across calls
+        self._client: Optional[httpx.Client] = None
+        # Runs blocking calls off the event loop thread, initialized on first use
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # Event loop thread for sync calls, initialized on first use so its async client outlives each call
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_finalizer: Optional[weakref.finalize] = None
+        self._loop_lock = threading.Lock()
+
+        # (fetched_at, story_ids) for the top stories list
+        self._topstories_cache: Optional[Tuple[float, List[int]]] = None
+        # LRU cache of story_id -> (fetched_at, item)
+        self._item_cache: "OrderedDict[int, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        # Sync calls fetch on the toolkit loop thread while async calls use the caller's, so guard the caches
+        self._cache_lock = threading.Lock()
+
+        # sync tools: used by agent.run() and agent.print_response()
+        # async tools: used by agent.arun() and agent.aprint_response()
         tools: List[Any] = []
+        async_tools: List[tuple] = []
         if all or enable_get_top_stories:
             tools.append(self.get_top_hackernews_stories)
+            async_tools.append((self.aget_top_hackernews_stories, "get_top_hackernews_stories"))
         if all or enable_get_user_details:
             tools.append(self.get_user_details)
+            async_tools.append((self.aget_user_details, "get_user_details"))
+
+        super().__init__(name="hackers_news", tools=tools, async_tools=async_tools, **kwargs)
+
+    def _get_client(self) -> httpx.Client:
+        """Return the shared HTTP client, creating it if necessary."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.Client(
+                base_url=_BASE_URL,
+                http2=True,
+                timeout=self.timeout,
+                limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+            )
+        return self._client
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Return the thread pool used to run blocking calls, creating it if necessary."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="agno-hackernews")
+        return self._executor
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """Return the event loop that runs sync calls, starting its thread if necessary."""
+        with self._loop_lock:
+            if self._loop is None:
+                loop = _new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name="agno-hackernews-loop", daemon=True)
+                thread.start()
+                self._loop = loop
+                # Also stops the thread if the toolkit is garbage collected without close()
+                self._loop_finalizer = weakref.finalize(self, _stop_loop, loop, thread)
+            return self._loop
+
+    def close(self) -> None:
+        """Closes the HTTP clients and stops the event loop thread and thread pool if they're running."""
+        if self._client is not None and not self._client.is_closed:
+            log_debug("Closing Hacker News HTTP client.")
+            self._client.close()
+        self._client = None
+        with self._loop_lock:
+            if self._loop_finalizer is not None:
+                self._loop_finalizer()
+            self._loop = None
+            self._loop_finalizer = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+        self._executor = None
 
-        super().__init__(name="hackers_news", tools=tools, **kwargs)
+    async def _afetch_story_ids(self, client: httpx.AsyncClient) -> List[int]:
+        """Fetch the IDs of the top stories, reusing the cached list while it is fresh."""
+        cached = self._topstories_cache
+        if cached is not None and time.monotonic() - cached[0] < _TOPSTORIES_TTL:
+            return cached[1]
+
+        response = await client.get("/v0/topstories.json", timeout=self.timeout)
+        story_ids = _loads(response)
+        self._topstories_cache = (time.monotonic(), story_ids)
+        return story_ids
+
+    async def _afetch_item(
+        self, client: httpx.AsyncClient, semaphore: asyncio.Semaphore, story_id: int
+    ) -> Optional[Dict[str, Any]]:
+        """Fetch a single item, reusing the cached copy while it is fresh."""
+        with self._cache_lock:
+            cached = self._item_cache.get(story_id)
+            if cached is not None and time.monotonic() - cached[0] < _ITEM_TTL:
+                self._item_cache.move_to_end(story_id)
+                return cached[1]
+
+        async with semaphore:
+            response = await client.get(_ITEM_PATH(story_id), timeout=self.timeout)
+        item = _loads(response)
+        # Deleted or missing items come back as null and are not cached
+        if item is not None:
+            with self._cache_lock:
+                self._item_cache[story_id] = (time.monotonic(), item)
+                self._item_cache.move_to_end(story_id)
+                if len(self._item_cache) > _ITEM_CACHE_SIZE:
+                    self._item_cache.popitem(last=False)
+        return item
+
+    async def _afetch_top_stories(self, num_stories: int) -> List[Dict[str, Any]]:
+        """Fetch the top stories, issuing the item requests concurrently.
+
+        Results are collected as they arrive. Every deleted or authorless item is replaced by the next
+        story in the ranking, so the caller gets `num_stories` stories without over-fetching up front.
+        """
+        # The API has no batch endpoint, and Firebase `orderBy="$key"` range queries on /v0/item can't pick out
+        # the non-contiguous top story IDs, so every item is requested on its own over the multiplexed connection.
+        # Bound the fan-out so large requests don't trip rate limits or exhaust sockets
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        client = await _aget_async_client()
+        story_ids = await self._afetch_story_ids(client)
+        candidates = iter(enumerate(story_ids))
+        pending: Dict["asyncio.Task[Optional[Dict[str, Any]]]", int] = {}
+
+        def schedule(count: int) -> None:
+            for rank, story_id in islice(candidates, count):
+                pending[asyncio.create_task(self._afetch_item(client, semaphore, story_id))] = rank
+
+        stories: Dict[int, Dict[str, Any]] = {}
+        # islice() rejects negative counts, so treat them like zero
+        schedule(max(num_stories, 0))
+        try:
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    rank = pending.pop(task)
+                    story = task.result() or {}
+                    by = story.get("by")
+                    if not by:
+                        schedule(1)
+                        continue
+                    story["username"] = by
+                    stories[rank] = story
+        finally:
+            # Only reached with tasks left when a request failed
+            for task in pending:
+                task.cancel()
+
+        return [stories[rank] for rank in sorted(stories)]
 
     def get_top_hackernews_stories(self, num_stories: int = 10) -> str:
         """Use this function to get top stories from Hacker News.
@@ -39,18 +307,24 @@ class HackerNewsTools(Toolkit):
         """
 
         log_debug(f"Getting top {num_stories} stories from Hacker News")
-        # Fetch top story IDs
-        response = httpx.get("https://hacker-news.firebaseio.com/v0/topstories.json")
-        story_ids = response.json()
-
-        # Fetch story details
-        stories = []
-        for story_id in story_ids[:num_stories]:
-            story_response = httpx.get(f"https://hacker-news.firebaseio.com/v0/item/{story_id}.json")
-            story = story_response.json()
-            story["username"] = story["by"]
-            stories.append(story)
-        return json.dumps(stories)
+        # Run on the toolkit's own loop thread, which also works when this thread is already running a loop
+        future = asyncio.run_coroutine_threadsafe(self._afetch_top_stories(num_stories), self._get_loop())
+        stories = future.result()
+        return _dumps(stories)
+
+    async def aget_top_hackernews_stories(self, num_stories: int = 10) -> str:
+        """Use this function to get top stories from Hacker News.
+
+        Args:
+            num_stories (int): Number of stories to return. Defaults to 10.
+
+        Returns:
+            str: JSON string of top stories.
+        """
+
+        log_debug(f"Getting top {num_stories} stories from Hacker News")
+        stories = await self._afetch_top_stories(num_stories)
+        return _dumps(stories)
 
     def get_user_details(self, username: str) -> str:
         """Use this function to get the details of a Hacker News user using their username.
@@ -64,14 +338,30 @@ class HackerNewsTools(Toolkit):
 
         try:
             log_debug(f"Getting details for user: {username}")
-            user = httpx.get(f"https://hacker-news.firebaseio.com/v0/user/{username}.json").json()
+            user = _loads(self._get_client().get(f"/v0/user/{username}.json"))
+            get = user.get
             user_details = {
-                "id": user.get("user_id"),
-                "karma": user.get("karma"),
-                "about": user.get("about"),
-                "total_items_submitted": len(user.get("submitted", [])),
+                "id": get("user_id"),
+                "karma": get("karma"),
+                "about": get("about"),
+                # `or ()` avoids allocating an empty list when the user has no submissions
+                "total_items_submitted": len(get("submitted") or ()),
             }
-            return json.dumps(user_details)
+            return _dumps(user_details)
         except Exception as e:
             logger.exception(e)
             return f"Error getting user details: {e}"
+
+    async def aget_user_details(self, username: str) -> str:
+        """Use this function to get the details of a Hacker News user using their username.
+
+        Args:
+            username (str): Username of the user to get details for.
+
+        Returns:
+            str: JSON string of the user details.
+        """
+
+        # Run the blocking lookup in the thread pool so the event loop can service other tool calls
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_executor(), self.get_user_details, username)
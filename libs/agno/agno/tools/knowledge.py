@@ -6,8 +6,12 @@ from agno.knowledge.document import Document
 from agno.knowledge.knowledge import Knowledge
 from agno.run import RunContext
 from agno.tools import Toolkit
+from agno.utils import log
 from agno.utils.log import log_debug, log_error
 
+_THOUGHTS_HEADER = "Thoughts:\n"
+_ANALYSIS_HEADER = "Analysis:\n"
+
 
 class KnowledgeTools(Toolkit):
     def __init__(
@@ -21,10 +25,13 @@ class KnowledgeTools(Toolkit):
         add_few_shot: bool = False,
         few_shot_examples: Optional[str] = None,
         all: bool = False,
+        max_thoughts: Optional[int] = 200,
         **kwargs,
     ):
         if knowledge is None:
             raise ValueError("knowledge must be provided when using KnowledgeTools")
+        if max_thoughts is not None and max_thoughts < 1:
+            raise ValueError("max_thoughts must be at least 1, or None to keep every thought")
 
         # Add instructions for using this toolkit
         if instructions is None:
@@ -39,6 +46,8 @@ class KnowledgeTools(Toolkit):
 
         # The knowledge to search
         self.knowledge: Knowledge = knowledge
+        # Only the most recent thoughts are kept in the session state. None keeps them all.
+        self.max_thoughts: Optional[int] = max_thoughts
 
         tools: List[Any] = []
         if enable_think or all:
@@ -69,7 +78,9 @@ class KnowledgeTools(Toolkit):
             str: The full log of reasoning and the new thought.
         """
         try:
-            log_debug(f"Thought: {thought}")
+            # Thoughts can be long, so only format the message when debug logging is on
+            if log.debug_on:
+                log_debug(f"Thought: {thought}")
 
             # Add the thought to the Agent state
             session_state = run_context.session_state
@@ -78,15 +89,16 @@ class KnowledgeTools(Toolkit):
                 run_context.session_state = session_state
             if "thoughts" not in session_state:
                 session_state["thoughts"] = []
-            session_state["thoughts"].append(thought)
+            thoughts = session_state["thoughts"]
+            thoughts.append(thought)
+
+            # Drop the oldest thoughts so the log doesn't grow for the whole session.
+            # A list, not a deque, is kept since the session state is stored as JSON.
+            if self.max_thoughts is not None and len(thoughts) > self.max_thoughts:
+                del thoughts[: len(thoughts) - self.max_thoughts]
 
             # Return the full log of thoughts and the new thought
-            thoughts = "\n".join([f"- {t}" for t in session_state["thoughts"]])
-            formatted_thoughts = dedent(
-                f"""Thoughts:
-                {thoughts}
-                """
-            ).strip()
+            formatted_thoughts = _THOUGHTS_HEADER + "\n".join(f"- {t}" for t in thoughts)
             return formatted_thoughts
         except Exception as e:
             log_error(f"Error recording thought: {e}")
@@ -125,7 +137,8 @@ class KnowledgeTools(Toolkit):
             str: The full log of thoughts and the new thought.
         """
         try:
-            log_debug(f"Analysis: {analysis}")
+            if log.debug_on:
+                log_debug(f"Analysis: {analysis}")
 
             # Add the thought to the Agent state
             session_state = run_context.session_state
@@ -138,11 +151,7 @@ class KnowledgeTools(Toolkit):
 
             # Return the full log of thoughts and the new thought
             analysis = "\n".join([f"- {a}" for a in session_state["analysis"]])
-            formatted_analysis = dedent(
-                f"""Analysis:
-                {analysis}
-                """
-            ).strip()
+            formatted_analysis = _ANALYSIS_HEADER + analysis
             return formatted_analysis
         except Exception as e:
             log_error(f"Error recording analysis: {e}")
@@ -1,17 +1,48 @@
 """Unit tests for HackerNewsTools class."""
 
+import asyncio
+import gc
 import json
+import os
+import threading
+from contextlib import ExitStack, contextmanager
+from functools import partial
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
 
+from agno.tools import hackernews
 from agno.tools.hackernews import HackerNewsTools
 
+_AsyncClient = httpx.AsyncClient
+_Client = httpx.Client
+
+
+@contextmanager
+def mock_hackernews_api(mock_get):
+    """Serve every Hacker News request from `mock_get`, which maps a URL to its JSON payload."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=json.dumps(mock_get(str(request.url))))
+
+    transport = httpx.MockTransport(handler)
+
+    with ExitStack() as stack:
+        stack.enter_context(
+            patch("agno.tools.hackernews.httpx.AsyncClient", partial(_AsyncClient, transport=transport))
+        )
+        stack.enter_context(patch("agno.tools.hackernews.httpx.Client", partial(_Client, transport=transport)))
+        yield
+
 
 @pytest.fixture
 def hackernews_tools():
     """Create a HackerNewsTools instance with all tools enabled."""
-    return HackerNewsTools()
+    tools = HackerNewsTools()
+    yield tools
+    tools.close()
 
 
 @pytest.fixture
@@ -94,17 +125,15 @@ class TestGetTopHackerNewsStories:
         ]
 
         def mock_get(url):
-            response = MagicMock()
             if "topstories" in url:
-                response.json.return_value = mock_story_ids
+                return mock_story_ids
             else:
                 # Extract story ID from URL
                 story_id = int(url.split("/")[-1].replace(".json", ""))
                 story = next((s for s in mock_stories if s["id"] == story_id), None)
-                response.json.return_value = story
-            return response
+                return story
 
-        with patch("agno.tools.hackernews.httpx.get", side_effect=mock_get):
+        with mock_hackernews_api(mock_get):
             result = hackernews_tools.get_top_hackernews_stories(num_stories=3)
 
         stories = json.loads(result)
@@ -123,15 +152,13 @@ class TestGetTopHackerNewsStories:
         }
 
         def mock_get(url):
-            response = MagicMock()
             if "topstories" in url:
-                response.json.return_value = mock_story_ids
+                return mock_story_ids
             else:
                 story_id = int(url.split("/")[-1].replace(".json", ""))
-                response.json.return_value = mock_stories.get(story_id, {})
-            return response
+                return mock_stories.get(story_id, {})
 
-        with patch("agno.tools.hackernews.httpx.get", side_effect=mock_get):
+        with mock_hackernews_api(mock_get):
             result = hackernews_tools.get_top_hackernews_stories(num_stories=2)
 
         stories = json.loads(result)
@@ -143,14 +170,12 @@ class TestGetTopHackerNewsStories:
         mock_story = {"id": 12345, "title": "Test Story", "by": "testuser", "score": 100}
 
         def mock_get(url):
-            response = MagicMock()
             if "topstories" in url:
-                response.json.return_value = mock_story_ids
+                return mock_story_ids
             else:
-                response.json.return_value = mock_story
-            return response
+                return mock_story
 
-        with patch("agno.tools.hackernews.httpx.get", side_effect=mock_get):
+        with mock_hackernews_api(mock_get):
             result = hackernews_tools.get_top_hackernews_stories(num_stories=1)
 
         stories = json.loads(result)
@@ -161,11 +186,9 @@ class TestGetTopHackerNewsStories:
         """Test handling of empty story list."""
 
         def mock_get(url):
-            response = MagicMock()
-            response.json.return_value = []
-            return response
+            return []
 
-        with patch("agno.tools.hackernews.httpx.get", side_effect=mock_get):
+        with mock_hackernews_api(mock_get):
             result = hackernews_tools.get_top_hackernews_stories(num_stories=10)
 
         stories = json.loads(result)
@@ -186,14 +209,12 @@ class TestGetTopHackerNewsStories:
         }
 
         def mock_get(url):
-            response = MagicMock()
             if "topstories" in url:
-                response.json.return_value = mock_story_ids
+                return mock_story_ids
             else:
-                response.json.return_value = mock_story
-            return response
+                return mock_story
 
-        with patch("agno.tools.hackernews.httpx.get", side_effect=mock_get):
+        with mock_hackernews_api(mock_get):
             result = hackernews_tools.get_top_hackernews_stories(num_stories=1)
 
         stories = json.loads(result)
@@ -203,6 +224,272 @@ class TestGetTopHackerNewsStories:
         assert stories[0]["descendants"] == 50
         assert stories[0]["url"] == "https://example.com/story"
 
+    def test_get_top_stories_skips_missing_items(self, hackernews_tools):
+        """Test that deleted items and items without an author are skipped."""
+        mock_story_ids = [1, 2, 3, 4]
+        mock_stories = {
+            1: {"id": 1, "title": "Story 1", "by": "user1"},
+            2: None,
+            3: {"id": 3, "title": "Story 3", "dead": True},
+            4: {"id": 4, "title": "Story 4", "by": ""},
+        }
+
+        def mock_get(url):
+            if "topstories" in url:
+                return mock_story_ids
+            else:
+                story_id = int(url.split("/")[-1].replace(".json", ""))
+                return mock_stories[story_id]
+
+        with mock_hackernews_api(mock_get):
+            result = hackernews_tools.get_top_hackernews_stories(num_stories=4)
+
+        stories = json.loads(result)
+        assert [story["id"] for story in stories] == [1]
+
+    def test_get_top_stories_inside_running_loop(self, hackernews_tools):
+        """Test that the sync tool still works when called from within a running event loop."""
+        mock_story_ids = [1, 2]
+        mock_stories = {
+            1: {"id": 1, "title": "Story 1", "by": "user1"},
+            2: {"id": 2, "title": "Story 2", "by": "user2"},
+        }
+
+        def mock_get(url):
+            if "topstories" in url:
+                return mock_story_ids
+            else:
+                story_id = int(url.split("/")[-1].replace(".json", ""))
+                return mock_stories[story_id]
+
+        async def call_from_loop():
+            return hackernews_tools.get_top_hackernews_stories(num_stories=2)
+
+        with mock_hackernews_api(mock_get):
+            result = asyncio.run(call_from_loop())
+
+        stories = json.loads(result)
+        assert [story["title"] for story in stories] == ["Story 1", "Story 2"]
+
+
+class TestEventLoop:
+    """Tests for the event loop used by the sync tool."""
+
+    @staticmethod
+    def mock_get(url):
+        if "topstories" in url:
+            return [1]
+        else:
+            return {"id": 1, "title": "Story 1", "by": "user1"}
+
+    def test_sync_call_uses_uvloop_when_installed(self, hackernews_tools):
+        """Test that the sync tool runs its event loop with uvloop when it is installed."""
+        mock_uvloop = MagicMock()
+        mock_uvloop.new_event_loop.side_effect = asyncio.new_event_loop
+
+        with mock_hackernews_api(self.mock_get), patch("agno.tools.hackernews.uvloop", mock_uvloop):
+            result = hackernews_tools.get_top_hackernews_stories(num_stories=1)
+
+        mock_uvloop.new_event_loop.assert_called_once()
+        assert json.loads(result)[0]["username"] == "user1"
+
+    def test_sync_call_without_uvloop(self, hackernews_tools):
+        """Test that the sync tool falls back to an asyncio event loop when uvloop is not installed."""
+        new_event_loop = asyncio.new_event_loop
+        with mock_hackernews_api(self.mock_get), patch("agno.tools.hackernews.uvloop", None):
+            with patch("agno.tools.hackernews.asyncio.new_event_loop", side_effect=new_event_loop) as mock_new:
+                result = hackernews_tools.get_top_hackernews_stories(num_stories=1)
+
+        mock_new.assert_called_once()
+        assert json.loads(result)[0]["username"] == "user1"
+
+    def test_sync_calls_reuse_one_loop(self, hackernews_tools):
+        """Test that repeated sync calls run on the same background event loop."""
+        with mock_hackernews_api(self.mock_get):
+            hackernews_tools.get_top_hackernews_stories(num_stories=1)
+            loop = hackernews_tools._loop
+            hackernews_tools.get_top_hackernews_stories(num_stories=1)
+
+        assert loop is not None
+        assert hackernews_tools._loop is loop
+        assert loop.is_running()
+
+    def test_close_stops_loop_thread(self, hackernews_tools):
+        """Test that close() stops and closes the background event loop."""
+        with mock_hackernews_api(self.mock_get):
+            hackernews_tools.get_top_hackernews_stories(num_stories=1)
+        loop = hackernews_tools._loop
+
+        hackernews_tools.close()
+
+        assert loop is not None and loop.is_closed()
+        assert hackernews_tools._loop is None
+        assert not any(thread.name == "agno-hackernews-loop" and thread.is_alive() for thread in threading.enumerate())
+
+    def test_loop_thread_stopped_when_toolkit_collected(self):
+        """Test that the background event loop is closed when the toolkit is garbage collected."""
+        tools = HackerNewsTools()
+        with mock_hackernews_api(self.mock_get):
+            tools.get_top_hackernews_stories(num_stories=1)
+        loop = tools._loop
+
+        del tools
+        gc.collect()
+
+        assert loop is not None and loop.is_closed()
+
+
+class TestAGetTopHackerNewsStories:
+    """Tests for aget_top_hackernews_stories method."""
+
+    def test_async_tools_registered(self, hackernews_tools):
+        """Test that the async variants are registered under the sync tool names."""
+        assert "get_top_hackernews_stories" in hackernews_tools.async_functions
+        assert "get_user_details" in hackernews_tools.async_functions
+
+    def test_async_tools_respect_flags(self, stories_only_tools):
+        """Test that disabled tools have no async variant."""
+        assert "get_top_hackernews_stories" in stories_only_tools.async_functions
+        assert "get_user_details" not in stories_only_tools.async_functions
+
+    async def test_aget_top_stories(self, hackernews_tools):
+        """Test getting top stories asynchronously."""
+        mock_story_ids = [1, 2, 3]
+        mock_stories = {
+            1: {"id": 1, "title": "Story 1", "by": "user1"},
+            2: {"id": 2, "title": "Story 2", "by": "user2"},
+            3: {"id": 3, "title": "Story 3", "by": "user3"},
+        }
+
+        def mock_get(url):
+            if "topstories" in url:
+                return mock_story_ids
+            else:
+                story_id = int(url.split("/")[-1].replace(".json", ""))
+                return mock_stories[story_id]
+
+        with mock_hackernews_api(mock_get):
+            result = await hackernews_tools.aget_top_hackernews_stories(num_stories=2)
+
+        stories = json.loads(result)
+        assert [story["title"] for story in stories] == ["Story 1", "Story 2"]
+        assert stories[1]["username"] == "user2"
+
+    async def test_aget_top_stories_uses_http2(self, hackernews_tools):
+        """Test that item requests share a single HTTP/2 client."""
+        created = []
+
+        def mock_get(url):
+            if "topstories" in url:
+                return [1, 2]
+            else:
+                story_id = int(url.split("/")[-1].replace(".json", ""))
+                return {"id": story_id, "by": "user"}
+
+        with mock_hackernews_api(mock_get):
+            async_client = httpx.AsyncClient
+
+            def record_client(**kwargs):
+                created.append(kwargs)
+                return async_client(**kwargs)
+
+            with patch("agno.tools.hackernews.httpx.AsyncClient", side_effect=record_client):
+                await hackernews_tools.aget_top_hackernews_stories(num_stories=2)
+
+        assert len(created) == 1
+        assert created[0]["http2"] is True
+
+    async def test_aget_top_stories_bounded_concurrency(self):
+        """Test that no more than max_concurrency item requests are in flight at once."""
+        tools = HackerNewsTools(max_concurrency=3)
+        in_flight = 0
+        max_in_flight = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, max_in_flight
+            if "topstories" in str(request.url):
+                return httpx.Response(200, json=list(range(1, 21)))
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            story_id = int(str(request.url).split("/")[-1].replace(".json", ""))
+            return httpx.Response(200, json={"id": story_id, "by": "user"})
+
+        transport = httpx.MockTransport(handler)
+        with patch("agno.tools.hackernews.httpx.AsyncClient", partial(_AsyncClient, transport=transport)):
+            result = await tools.aget_top_hackernews_stories(num_stories=20)
+
+        assert len(json.loads(result)) == 20
+        assert max_in_flight == 3
+
+    async def test_aget_top_stories_backfills_missing_items(self, hackernews_tools):
+        """Test that missing items are replaced by the next stories in the ranking."""
+        requested_urls = []
+        mock_stories = {
+            1: {"id": 1, "by": "user1"},
+            2: None,
+            3: {"id": 3, "dead": True},
+            4: {"id": 4, "by": "user4"},
+            5: {"id": 5, "by": "user5"},
+            6: {"id": 6, "by": "user6"},
+        }
+
+        def mock_get(url):
+            requested_urls.append(url)
+            if "topstories" in url:
+                return list(mock_stories)
+            else:
+                story_id = int(url.split("/")[-1].replace(".json", ""))
+                return mock_stories[story_id]
+
+        with mock_hackernews_api(mock_get):
+            result = await hackernews_tools.aget_top_hackernews_stories(num_stories=3)
+
+        assert [story["id"] for story in json.loads(result)] == [1, 4, 5]
+        assert not any(url.endswith("/item/6.json") for url in requested_urls)
+
+    async def test_aget_top_stories_keeps_ranking_order(self, hackernews_tools):
+        """Test that stories are returned in ranking order, not completion order."""
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            if "topstories" in str(request.url):
+                return httpx.Response(200, json=[1, 2, 3])
+            story_id = int(str(request.url).split("/")[-1].replace(".json", ""))
+            # Lower ranked stories respond first
+            await asyncio.sleep(0.01 * (4 - story_id))
+            return httpx.Response(200, json={"id": story_id, "by": "user"})
+
+        transport = httpx.MockTransport(handler)
+        with patch("agno.tools.hackernews.httpx.AsyncClient", partial(_AsyncClient, transport=transport)):
+            result = await hackernews_tools.aget_top_hackernews_stories(num_stories=3)
+
+        assert [story["id"] for story in json.loads(result)] == [1, 2, 3]
+
+    async def test_aget_top_stories_cancels_pending_on_error(self, hackernews_tools):
+        """Test that a failed item request cancels the requests still in flight."""
+        cancelled = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            if "topstories" in str(request.url):
+                return httpx.Response(200, json=[1, 2])
+            if str(request.url).endswith("/item/1.json"):
+                raise httpx.ConnectError("Network error")
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(str(request.url))
+                raise
+            return httpx.Response(200, json={"id": 2, "by": "user"})
+
+        transport = httpx.MockTransport(handler)
+        with patch("agno.tools.hackernews.httpx.AsyncClient", partial(_AsyncClient, transport=transport)):
+            with pytest.raises(httpx.ConnectError):
+                await hackernews_tools.aget_top_hackernews_stories(num_stories=2)
+            await asyncio.sleep(0)
+
+        assert len(cancelled) == 1
+
 
 class TestGetUserDetails:
     """Tests for get_user_details method."""
@@ -216,10 +503,7 @@ class TestGetUserDetails:
             "submitted": [1, 2, 3, 4, 5],
         }
 
-        mock_response = MagicMock()
-        mock_response.json.return_value = mock_user
-
-        with patch("agno.tools.hackernews.httpx.get", return_value=mock_response):
+        with mock_hackernews_api(lambda url: mock_user):
             result = hackernews_tools.get_user_details("testuser")
 
         user_details = json.loads(result)
@@ -236,10 +520,7 @@ class TestGetUserDetails:
             "submitted": [],
         }
 
-        mock_response = MagicMock()
-        mock_response.json.return_value = mock_user
-
-        with patch("agno.tools.hackernews.httpx.get", return_value=mock_response):
+        with mock_hackernews_api(lambda url: mock_user):
             result = hackernews_tools.get_user_details("testuser123")
 
         user_details = json.loads(result)
@@ -254,10 +535,7 @@ class TestGetUserDetails:
             # No 'submitted' key
         }
 
-        mock_response = MagicMock()
-        mock_response.json.return_value = mock_user
-
-        with patch("agno.tools.hackernews.httpx.get", return_value=mock_response):
+        with mock_hackernews_api(lambda url: mock_user):
             result = hackernews_tools.get_user_details("newuser")
 
         user_details = json.loads(result)
@@ -271,10 +549,7 @@ class TestGetUserDetails:
             "submitted": [1, 2],
         }
 
-        mock_response = MagicMock()
-        mock_response.json.return_value = mock_user
-
-        with patch("agno.tools.hackernews.httpx.get", return_value=mock_response):
+        with mock_hackernews_api(lambda url: mock_user):
             result = hackernews_tools.get_user_details("quietuser")
 
         user_details = json.loads(result)
@@ -282,7 +557,11 @@ class TestGetUserDetails:
 
     def test_get_user_details_error_handling(self, hackernews_tools):
         """Test error handling when API call fails."""
-        with patch("agno.tools.hackernews.httpx.get", side_effect=Exception("Network error")):
+
+        def mock_get(url):
+            raise Exception("Network error")
+
+        with mock_hackernews_api(mock_get):
             result = hackernews_tools.get_user_details("testuser")
 
         assert "Error getting user details" in result
@@ -290,16 +569,354 @@ class TestGetUserDetails:
 
     def test_get_user_details_null_user(self, hackernews_tools):
         """Test handling of non-existent user (returns null)."""
-        mock_response = MagicMock()
-        mock_response.json.return_value = None
-
-        with patch("agno.tools.hackernews.httpx.get", return_value=mock_response):
+        with mock_hackernews_api(lambda url: None):
             result = hackernews_tools.get_user_details("nonexistentuser12345")
 
         # Should handle None gracefully by catching the exception
         assert "Error getting user details" in result
 
 
+class _HackerNewsHandler(BaseHTTPRequestHandler):
+    """Serve a fixed top stories list and items from a real local socket."""
+
+    def do_GET(self):
+        if "topstories" in self.path:
+            payload = [1, 2, 3]
+        else:
+            story_id = int(self.path.split("/")[-1].replace(".json", ""))
+            payload = {"id": story_id, "by": f"user{story_id}"}
+        body = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def hackernews_server():
+    """Run a local Hacker News API and point the toolkit at it."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _HackerNewsHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    with patch("agno.tools.hackernews._BASE_URL", f"http://127.0.0.1:{server.server_address[1]}"):
+        yield
+    server.shutdown()
+    server.server_close()
+
+
+def _open_sockets() -> int:
+    fd_dir = "/proc/self/fd"
+    count = 0
+    for fd in os.listdir(fd_dir):
+        try:
+            count += os.readlink(os.path.join(fd_dir, fd)).startswith("socket:")
+        except OSError:
+            pass
+    return count
+
+
+class TestSharedAsyncClient:
+    """Tests for the async client shared per event loop."""
+
+    async def test_async_client_shared_across_instances(self):
+        """Test that toolkits on the same event loop share one async client."""
+        created = []
+
+        def mock_get(url):
+            if "topstories" in url:
+                return [1]
+            else:
+                return {"id": 1, "by": "user"}
+
+        with mock_hackernews_api(mock_get):
+            async_client = httpx.AsyncClient
+
+            def record_client(**kwargs):
+                created.append(async_client(**kwargs))
+                return created[-1]
+
+            with patch("agno.tools.hackernews.httpx.AsyncClient", side_effect=record_client):
+                await HackerNewsTools().aget_top_hackernews_stories(num_stories=1)
+                await HackerNewsTools().aget_top_hackernews_stories(num_stories=1)
+
+        assert len(created) == 1
+        assert not created[0].is_closed
+        await created[0].aclose()
+
+    def test_sync_calls_keep_their_async_client(self, hackernews_tools):
+        """Test that sync calls reuse one async client until the toolkit is closed."""
+        created = []
+
+        def mock_get(url):
+            if "topstories" in url:
+                return [1]
+            else:
+                return {"id": 1, "by": "user"}
+
+        with mock_hackernews_api(mock_get):
+            async_client = httpx.AsyncClient
+
+            def record_client(**kwargs):
+                created.append(async_client(**kwargs))
+                return created[-1]
+
+            with patch("agno.tools.hackernews.httpx.AsyncClient", side_effect=record_client):
+                hackernews_tools.get_top_hackernews_stories(num_stories=1)
+                # Expired cache entries force the second call to go back to the network
+                hackernews_tools._topstories_cache = None
+                hackernews_tools._item_cache.clear()
+                hackernews_tools.get_top_hackernews_stories(num_stories=1)
+
+        assert len(created) == 1
+        assert not created[0].is_closed
+
+        hackernews_tools.close()
+        assert created[0].is_closed
+
+    @pytest.mark.skipif(not os.path.isdir("/proc/self/fd"), reason="Needs /proc to count open sockets")
+    def test_repeated_asyncio_run_releases_clients(self, hackernews_server):
+        """Test that each short-lived loop closes its client and sockets when it shuts down."""
+        clients_on_loop = []
+
+        async def fetch():
+            result = await HackerNewsTools().aget_top_hackernews_stories(num_stories=3)
+            clients_on_loop.append(len(hackernews._ASYNC_CLIENTS))
+            return result
+
+        # Warm up so lazily created sockets (e.g. the loop's self-pipe) are part of the baseline
+        asyncio.run(fetch())
+        gc.collect()
+        baseline = _open_sockets()
+
+        for _ in range(5):
+            result = asyncio.run(fetch())
+            assert len(json.loads(result)) == 3
+        gc.collect()
+
+        assert clients_on_loop == [1] * 6
+        assert len(hackernews._ASYNC_CLIENTS) == 0
+        assert _open_sockets() <= baseline
+
+    def test_clients_of_closed_loops_are_dropped(self, hackernews_server):
+        """Test that a loop closed without shutting down async generators doesn't keep its client."""
+        loop = asyncio.new_event_loop()
+        loop.run_until_complete(HackerNewsTools().aget_top_hackernews_stories(num_stories=1))
+        # Close without shutdown_asyncgens(), so the client is never finalized by its loop
+        loop.close()
+        assert loop in hackernews._ASYNC_CLIENTS
+
+        asyncio.run(HackerNewsTools().aget_top_hackernews_stories(num_stories=1))
+
+        assert loop not in hackernews._ASYNC_CLIENTS
+
+
+class TestAGetUserDetails:
+    """Tests for aget_user_details method."""
+
+    async def test_aget_user_details(self, hackernews_tools):
+        """Test that the blocking lookup runs on the toolkit's thread pool."""
+        mock_user = {"user_id": "testuser", "karma": 42, "about": "Hi", "submitted": [1, 2]}
+        threads = []
+
+        def mock_get(url):
+            threads.append(threading.current_thread().name)
+            return mock_user
+
+        with mock_hackernews_api(mock_get):
+            result = await hackernews_tools.aget_user_details("testuser")
+
+        user_details = json.loads(result)
+        assert user_details["id"] == "testuser"
+        assert user_details["total_items_submitted"] == 2
+        assert threads[0].startswith("agno-hackernews")
+
+    async def test_aget_user_details_error_handling(self, hackernews_tools):
+        """Test error handling when API call fails."""
+
+        def mock_get(url):
+            raise Exception("Network error")
+
+        with mock_hackernews_api(mock_get):
+            result = await hackernews_tools.aget_user_details("testuser")
+
+        assert "Error getting user details" in result
+
+
+class TestHttpClient:
+    """Tests for the shared HTTP client."""
+
+    def test_client_reused_across_calls(self, hackernews_tools):
+        """Test that the same client, and so the same connection pool, serves every call."""
+        mock_user = {"id": "testuser", "karma": 1, "submitted": []}
+
+        with mock_hackernews_api(lambda url: mock_user):
+            hackernews_tools.get_user_details("testuser")
+            client = hackernews_tools._client
+            hackernews_tools.get_user_details("testuser")
+
+        assert client is not None
+        assert hackernews_tools._client is client
+
+    def test_close(self, hackernews_tools):
+        """Test that close() closes the client and a new one is created on next use."""
+        mock_user = {"id": "testuser", "karma": 1, "submitted": []}
+
+        with mock_hackernews_api(lambda url: mock_user):
+            hackernews_tools.get_user_details("testuser")
+            client = hackernews_tools._client
+            hackernews_tools.close()
+
+            assert client.is_closed
+            assert hackernews_tools._client is None
+
+            result = hackernews_tools.get_user_details("testuser")
+
+        assert json.loads(result)["karma"] == 1
+        assert hackernews_tools._client is not client
+
+
+class TestCaching:
+    """Tests for caching of the top stories list and items."""
+
+    @staticmethod
+    def make_mock_get(requested_urls):
+        def mock_get(url):
+            requested_urls.append(url)
+            if "topstories" in url:
+                return [1, 2, 3]
+            else:
+                story_id = int(url.split("/")[-1].replace(".json", ""))
+                return {"id": story_id, "title": f"Story {story_id}", "by": f"user{story_id}"}
+
+        return mock_get
+
+    def test_repeated_calls_use_cache(self, hackernews_tools):
+        """Test that a second call within the TTL makes no requests."""
+        requested_urls = []
+
+        with mock_hackernews_api(self.make_mock_get(requested_urls)):
+            first = hackernews_tools.get_top_hackernews_stories(num_stories=2)
+            second = hackernews_tools.get_top_hackernews_stories(num_stories=2)
+
+        assert len(requested_urls) == 3
+        assert json.loads(first) == json.loads(second)
+
+    def test_cached_ids_reused_for_more_stories(self, hackernews_tools):
+        """Test that asking for more stories only fetches the items not yet cached."""
+        requested_urls = []
+
+        with mock_hackernews_api(self.make_mock_get(requested_urls)):
+            hackernews_tools.get_top_hackernews_stories(num_stories=1)
+            result = hackernews_tools.get_top_hackernews_stories(num_stories=3)
+
+        assert sum("topstories" in url for url in requested_urls) == 1
+        assert sum(url.endswith("/item/1.json") for url in requested_urls) == 1
+        assert len(json.loads(result)) == 3
+
+    def test_cache_expires(self, hackernews_tools):
+        """Test that the top stories list and items are fetched again once stale."""
+        requested_urls = []
+
+        with mock_hackernews_api(self.make_mock_get(requested_urls)):
+            with patch("agno.tools.hackernews.time.monotonic", return_value=1000.0):
+                hackernews_tools.get_top_hackernews_stories(num_stories=1)
+            with patch("agno.tools.hackernews.time.monotonic", return_value=2000.0):
+                hackernews_tools.get_top_hackernews_stories(num_stories=1)
+
+        assert len(requested_urls) == 4
+
+    def test_deleted_items_not_cached(self, hackernews_tools):
+        """Test that null items are fetched again on the next call."""
+        requested_urls = []
+
+        def mock_get(url):
+            requested_urls.append(url)
+            if "topstories" in url:
+                return [1]
+            else:
+                return None
+
+        with mock_hackernews_api(mock_get):
+            hackernews_tools.get_top_hackernews_stories(num_stories=1)
+            hackernews_tools.get_top_hackernews_stories(num_stories=1)
+
+        assert sum(url.endswith("/item/1.json") for url in requested_urls) == 2
+
+    def test_item_cache_is_bounded(self, hackernews_tools):
+        """Test that the least recently used items are evicted."""
+        story_ids = [1, 2]
+
+        def mock_get(url):
+            if "topstories" in url:
+                return story_ids
+            else:
+                story_id = int(url.split("/")[-1].replace(".json", ""))
+                return {"id": story_id, "title": f"Story {story_id}", "by": f"user{story_id}"}
+
+        def fetch(*ids):
+            story_ids[:] = ids
+            # Refetch the ranking so each call reads the IDs it was given
+            hackernews_tools._topstories_cache = None
+            hackernews_tools.get_top_hackernews_stories(num_stories=len(ids))
+
+        with mock_hackernews_api(mock_get), patch("agno.tools.hackernews._ITEM_CACHE_SIZE", 2):
+            fetch(1, 2)
+            # A cache hit on item 1 makes item 2 the least recently used
+            fetch(1)
+            fetch(3)
+
+        assert list(hackernews_tools._item_cache) == [1, 3]
+
+
+class TestJsonSerialization:
+    """Tests for JSON encoding of tool results and decoding of API responses."""
+
+    def test_user_details_without_orjson(self, hackernews_tools):
+        """Test that results fall back to the standard library when orjson is not installed."""
+        mock_user = {"user_id": "testuser", "karma": 10, "about": "Caf\u00e9", "submitted": [1]}
+
+        with mock_hackernews_api(lambda url: mock_user), patch("agno.tools.hackernews.orjson", None):
+            result = hackernews_tools.get_user_details("testuser")
+
+        assert result == json.dumps({"id": "testuser", "karma": 10, "about": "Caf\u00e9", "total_items_submitted": 1})
+
+    def test_stories_decoded_without_orjson(self, hackernews_tools):
+        """Test that responses are decoded with the standard library when orjson is not installed."""
+        mock_story = {"id": 1, "title": "Story 1", "by": "user1"}
+
+        def mock_get(url):
+            if "topstories" in url:
+                return [1]
+            else:
+                return mock_story
+
+        with mock_hackernews_api(mock_get), patch("agno.tools.hackernews.orjson", None):
+            result = hackernews_tools.get_top_hackernews_stories(num_stories=1)
+
+        assert json.loads(result) == [{**mock_story, "username": "user1"}]
+
+    def test_stories_with_and_without_orjson_match(self, hackernews_tools):
+        """Test that both serializers produce the same JSON document."""
+        mock_story = {"id": 1, "title": "Story \u2603", "by": "user1", "kids": [2, 3]}
+
+        def mock_get(url):
+            if "topstories" in url:
+                return [1]
+            else:
+                return mock_story
+
+        with mock_hackernews_api(mock_get):
+            result = hackernews_tools.get_top_hackernews_stories(num_stories=1)
+            with patch("agno.tools.hackernews.orjson", None):
+                fallback_result = hackernews_tools.get_top_hackernews_stories(num_stories=1)
+
+        assert json.loads(result) == json.loads(fallback_result)
+
+
 class TestToolkitIntegration:
     """Integration tests for HackerNewsTools as a Toolkit."""
 
@@ -332,16 +949,27 @@ class TestEdgeCases:
         mock_story_ids = [1, 2, 3]
 
         def mock_get(url):
-            response = MagicMock()
-            response.json.return_value = mock_story_ids
-            return response
+            return mock_story_ids
 
-        with patch("agno.tools.hackernews.httpx.get", side_effect=mock_get):
+        with mock_hackernews_api(mock_get):
             result = hackernews_tools.get_top_hackernews_stories(num_stories=0)
 
         stories = json.loads(result)
         assert len(stories) == 0
 
+    def test_get_top_stories_negative_count(self, hackernews_tools):
+        """Test that a negative count returns no stories instead of raising."""
+        mock_story_ids = [1, 2, 3]
+
+        def mock_get(url):
+            return mock_story_ids
+
+        with mock_hackernews_api(mock_get):
+            result = hackernews_tools.get_top_hackernews_stories(num_stories=-1)
+
+        stories = json.loads(result)
+        assert len(stories) == 0
+
     def test_get_top_stories_more_than_available(self, hackernews_tools):
         """Test requesting more stories than available."""
         mock_story_ids = [1, 2]
@@ -351,15 +979,13 @@ class TestEdgeCases:
         }
 
         def mock_get(url):
-            response = MagicMock()
             if "topstories" in url:
-                response.json.return_value = mock_story_ids
+                return mock_story_ids
             else:
                 story_id = int(url.split("/")[-1].replace(".json", ""))
-                response.json.return_value = mock_stories.get(story_id, {})
-            return response
+                return mock_stories.get(story_id, {})
 
-        with patch("agno.tools.hackernews.httpx.get", side_effect=mock_get):
+        with mock_hackernews_api(mock_get):
             result = hackernews_tools.get_top_hackernews_stories(num_stories=100)
 
         stories = json.loads(result)
@@ -374,10 +1000,7 @@ class TestEdgeCases:
             "submitted": [],
         }
 
-        mock_response = MagicMock()
-        mock_response.json.return_value = mock_user
-
-        with patch("agno.tools.hackernews.httpx.get", return_value=mock_response):
+        with mock_hackernews_api(lambda url: mock_user):
             result = hackernews_tools.get_user_details("user_with-special.chars")
 
         user_details = json.loads(result)
@@ -394,14 +1017,12 @@ class TestEdgeCases:
         }
 
         def mock_get(url):
-            response = MagicMock()
             if "topstories" in url:
-                response.json.return_value = mock_story_ids
+                return mock_story_ids
             else:
-                response.json.return_value = mock_story
-            return response
+                return mock_story
 
-        with patch("agno.tools.hackernews.httpx.get", side_effect=mock_get):
+        with mock_hackernews_api(mock_get):
             result = hackernews_tools.get_top_hackernews_stories(num_stories=1)
 
         stories = json.loads(result)
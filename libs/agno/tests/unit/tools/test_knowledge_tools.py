@@ -0,0 +1,136 @@
+"""Unit tests for KnowledgeTools class."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from agno.run import RunContext
+from agno.tools.knowledge import KnowledgeTools
+
+
+@pytest.fixture
+def knowledge_tools():
+    """Create a KnowledgeTools instance backed by a mock knowledge base."""
+    return KnowledgeTools(knowledge=MagicMock())
+
+
+@pytest.fixture
+def run_context():
+    """Create a RunContext with an empty session state."""
+    return RunContext(run_id="test_run", session_id="test_session", session_state={})
+
+
+class TestThink:
+    """Tests for the think method."""
+
+    def test_think_returns_full_log(self, knowledge_tools, run_context):
+        """Test that every call returns all thoughts recorded so far."""
+        knowledge_tools.think(run_context, "First thought")
+        result = knowledge_tools.think(run_context, "Second thought")
+
+        assert result == "Thoughts:\n- First thought\n- Second thought"
+        assert run_context.session_state["thoughts"] == ["First thought", "Second thought"]
+
+    def test_think_initializes_missing_session_state(self, knowledge_tools):
+        """Test that a session state is created when the run has none."""
+        run_context = RunContext(run_id="test_run", session_id="test_session")
+
+        result = knowledge_tools.think(run_context, "A thought")
+
+        assert result == "Thoughts:\n- A thought"
+        assert run_context.session_state["thoughts"] == ["A thought"]
+
+    def test_think_renders_existing_thoughts(self, knowledge_tools, run_context):
+        """Test that thoughts stored before the rendered log existed are included."""
+        run_context.session_state["thoughts"] = ["Earlier thought"]
+
+        result = knowledge_tools.think(run_context, "New thought")
+
+        assert result == "Thoughts:\n- Earlier thought\n- New thought"
+
+    def test_think_rerenders_after_thoughts_reset(self, knowledge_tools, run_context):
+        """Test that thoughts cleared from the session state are not returned again."""
+        knowledge_tools.think(run_context, "Old thought A")
+        knowledge_tools.think(run_context, "Old thought B")
+        run_context.session_state["thoughts"] = []
+
+        result = knowledge_tools.think(run_context, "New thought")
+
+        assert result == "Thoughts:\n- New thought"
+        assert run_context.session_state["thoughts"] == ["New thought"]
+
+    def test_think_renders_edited_thoughts(self, knowledge_tools, run_context):
+        """Test that thoughts replaced in the session state are returned as they are now."""
+        knowledge_tools.think(run_context, "Old thought A")
+        knowledge_tools.think(run_context, "Old thought B")
+        run_context.session_state["thoughts"] = ["New thought A", "New thought B"]
+
+        result = knowledge_tools.think(run_context, "C")
+
+        assert result == "Thoughts:\n- New thought A\n- New thought B\n- C"
+
+    def test_think_stores_only_the_thoughts(self, knowledge_tools, run_context):
+        """Test that the log is not kept a second time in the session state."""
+        knowledge_tools.think(run_context, "A thought")
+
+        assert run_context.session_state == {"thoughts": ["A thought"]}
+
+    def test_think_keeps_most_recent_thoughts(self, run_context):
+        """Test that only the last max_thoughts thoughts are kept and returned."""
+        knowledge_tools = KnowledgeTools(knowledge=MagicMock(), max_thoughts=2)
+
+        for thought in ["First", "Second", "Third"]:
+            result = knowledge_tools.think(run_context, thought)
+
+        assert result == "Thoughts:\n- Second\n- Third"
+        assert run_context.session_state["thoughts"] == ["Second", "Third"]
+
+        result = knowledge_tools.think(run_context, "Fourth")
+        assert result == "Thoughts:\n- Third\n- Fourth"
+
+    @pytest.mark.parametrize("max_thoughts", [0, -1])
+    def test_think_rejects_thought_limit_below_one(self, max_thoughts):
+        """Test that a limit which would drop the new thought is rejected."""
+        with pytest.raises(ValueError, match="max_thoughts"):
+            KnowledgeTools(knowledge=MagicMock(), max_thoughts=max_thoughts)
+
+    def test_think_without_thought_limit(self, run_context):
+        """Test that max_thoughts=None keeps every thought."""
+        knowledge_tools = KnowledgeTools(knowledge=MagicMock(), max_thoughts=None)
+
+        for i in range(300):
+            knowledge_tools.think(run_context, f"Thought {i}")
+
+        assert len(run_context.session_state["thoughts"]) == 300
+
+    def test_think_skips_debug_log_when_debug_off(self, knowledge_tools, run_context):
+        """Test that the thought is not formatted into a log message unless debug logging is on."""
+        with patch("agno.tools.knowledge.log_debug") as mock_log_debug, patch("agno.utils.log.debug_on", False):
+            knowledge_tools.think(run_context, "A thought")
+
+        mock_log_debug.assert_not_called()
+
+    def test_think_logs_when_debug_on(self, knowledge_tools, run_context):
+        """Test that the thought is logged when debug logging is on."""
+        with patch("agno.tools.knowledge.log_debug") as mock_log_debug, patch("agno.utils.log.debug_on", True):
+            knowledge_tools.think(run_context, "A thought")
+
+        mock_log_debug.assert_called_once_with("Thought: A thought")
+
+
+class TestAnalyze:
+    """Tests for the analyze method."""
+
+    def test_analyze_returns_full_log(self, knowledge_tools, run_context):
+        """Test that every call returns all analyses recorded so far."""
+        knowledge_tools.analyze(run_context, "Results are incomplete")
+        result = knowledge_tools.analyze(run_context, "Results are sufficient")
+
+        assert result == "Analysis:\n- Results are incomplete\n- Results are sufficient"
+        assert run_context.session_state["analysis"] == ["Results are incomplete", "Results are sufficient"]
+
+    def test_analyze_multiline_entry(self, knowledge_tools, run_context):
+        """Test that multi-line analyses are returned as-is."""
+        result = knowledge_tools.analyze(run_context, "Line one\n    indented line two")
+
+        assert result == "Analysis:\n- Line one\n    indented line two"